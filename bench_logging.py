@@ -0,0 +1,121 @@
+"""Benchmark the per-transaction logging overhead of add_transaction().
+
+Compares the old setup (a plain FileHandler on the root logger, as
+basicConfig used to install at import time) against setup_logging()
+(QueueHandler/QueueListener feeding a rotating file handler). A run with
+logging disabled gives the cost of the transaction itself. Each setup is
+measured on local storage and with a simulated per-write latency, as seen
+on a slow disk or network share.
+
+It also compares eager f-string messages with lazy %-style messages when
+the record is filtered out by the log level.
+
+Usage: python bench_logging.py [number_of_transactions] [write_latency_ms]
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+import timeit
+
+import project
+
+TRANSACTION_INPUTS = ["Expense", "2024-05-14", "Grocery shopping", "Groceries", "42.50"]
+
+
+def run_transactions(count):
+    """Add count transactions and return the mean time per transaction in microseconds."""
+    feed = iter(TRANSACTION_INPUTS * count)
+    project.input = lambda prompt: next(feed)
+    project.print = lambda *args, **kwargs: None
+    try:
+        start = time.perf_counter()
+        for _ in range(count):
+            project.add_transaction()
+        elapsed = time.perf_counter() - start
+    finally:
+        del project.input
+        del project.print
+    return elapsed / count * 1e6
+
+
+def add_write_latency(handler, latency):
+    """Make every write of handler take at least latency seconds."""
+    emit = handler.emit
+
+    def slow_emit(record):
+        time.sleep(latency)
+        emit(record)
+
+    handler.emit = slow_emit
+
+
+def measure_old(log_file, count, latency):
+    """Time transactions with the FileHandler project.py used to install at import time."""
+    handler = logging.FileHandler(log_file)
+    handler.setFormatter(logging.Formatter(project.LOG_FORMAT))
+    if latency:
+        add_write_latency(handler, latency)
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    try:
+        return run_transactions(count)
+    finally:
+        root.removeHandler(handler)
+        handler.close()
+
+
+def measure_new(log_file, count, latency):
+    """Time transactions with the queue-based pipeline from setup_logging()."""
+    listener = project.setup_logging(log_file)
+    if latency:
+        for handler in listener.handlers:
+            add_write_latency(handler, latency)
+    try:
+        return run_transactions(count)
+    finally:
+        project.shutdown_logging(listener)
+
+
+def measure_filtered_message(number=200000):
+    """Return the cost in microseconds of a filtered-out INFO call, eager and lazy."""
+    logger = logging.getLogger("bench_logging.filtered")
+    logger.setLevel(logging.WARNING)
+    values = ("2024-05-14", "Grocery shopping", "Groceries", -42.5, "Expense")
+    eager = timeit.timeit(lambda: logger.info(f"Transaction added successfully: {values[0]}, {values[1]}, {values[2]}, {values[3]}, {values[4]}"), number=number)
+    lazy = timeit.timeit(lambda: logger.info("Transaction added successfully: %s, %s, %s, %s, %s", *values), number=number)
+    return eager / number * 1e6, lazy / number * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.001
+    with tempfile.TemporaryDirectory() as tmp:
+        project.DATA_FILE = os.path.join(tmp, "transactions.csv")
+        project.initialize_data_file()
+
+        logging.disable(logging.CRITICAL)
+        baseline = run_transactions(count)
+        logging.disable(logging.NOTSET)
+
+        results = [
+            ("Before (plain FileHandler)", measure_old(os.path.join(tmp, "old.log"), count, 0)),
+            ("After (queue + rotation)", measure_new(os.path.join(tmp, "new.log"), count, 0)),
+            (f"Before, {latency * 1000:g} ms writes", measure_old(os.path.join(tmp, "old_slow.log"), count, latency)),
+            (f"After, {latency * 1000:g} ms writes", measure_new(os.path.join(tmp, "new_slow.log"), count, latency)),
+        ]
+
+    print(f"Transactions per run:          {count:8d}")
+    print(f"No logging:                    {baseline:8.2f} us/transaction")
+    for label, result in results:
+        print(f"{label + ':':<30}{result:8.2f} us/transaction ({result - baseline:+.2f} us logging)")
+
+    eager, lazy = measure_filtered_message()
+    print(f"Filtered INFO call, f-string:  {eager:8.2f} us")
+    print(f"Filtered INFO call, %-style:   {lazy:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
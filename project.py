@@ -3,12 +3,49 @@ import csv
 import shutil
 import datetime
 import logging
+import logging.handlers
+import queue
 
 DATA_FILE = "transactions.csv"
 BACKUP_FOLDER = "backups"
 LOG_FILE = "financial_assistant.log"
-
-logging.basicConfig(filename=LOG_FILE, level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+logger = logging.getLogger(__name__)
+
+def setup_logging(log_file=LOG_FILE, level=logging.INFO, max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT, when=None):
+    """Configure non-blocking, rotating logging and return the started listener.
+
+    Log records are put on an in-memory queue and written to disk by a
+    background thread. The file rotates at max_bytes, or on the 'when'
+    interval (e.g. 'midnight') if one is given. Pass the returned listener
+    to shutdown_logging() to flush pending records before exiting.
+    """
+    if when:
+        file_handler = logging.handlers.TimedRotatingFileHandler(log_file, when=when, backupCount=backup_count)
+    else:
+        file_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.queue_handler = queue_handler
+    listener.start()
+    return listener
+
+def shutdown_logging(listener):
+    """Flush queued log records and detach the handlers added by setup_logging."""
+    listener.stop()
+    logging.getLogger().removeHandler(listener.queue_handler)
+    for handler in listener.handlers:
+        handler.close()
 
 def initialize_data_file():
     """Initialize the data file if it doesn't exist."""
@@ -16,7 +53,7 @@ def initialize_data_file():
         with open(DATA_FILE, 'w', newline='') as file:
             writer = csv.writer(file)
             writer.writerow(["Date", "Description", "Category", "Amount", "Type"])
-        logging.info("Data file initialized successfully.")
+        logger.info("Data file initialized successfully.")
 
 def backup_data():
     """Backup the data file."""
@@ -24,7 +61,7 @@ def backup_data():
         os.makedirs(BACKUP_FOLDER)
     backup_file = os.path.join(BACKUP_FOLDER, f"transactions_backup_{datetime.datetime.now():%Y%m%d%H%M%S}.csv")
     shutil.copy(DATA_FILE, backup_file)
-    logging.info(f"Data backed up successfully to {backup_file}")
+    logger.info("Data backed up successfully to %s", backup_file)
     print("Data backed up successfully.")
 
 def recover_data():
@@ -45,7 +82,7 @@ def recover_data():
             if 0 <= backup_index < len(backup_files):
                 backup_file = os.path.join(BACKUP_FOLDER, backup_files[backup_index])
                 shutil.copy(backup_file, DATA_FILE)
-                logging.info(f"Data recovered successfully from {backup_file}")
+                logger.info("Data recovered successfully from %s", backup_file)
                 print("Data recovered successfully.")
             else:
                 print("Invalid backup file choice.")
@@ -75,7 +112,7 @@ def add_transaction():
         with open(DATA_FILE, 'a', newline='') as file:
             writer = csv.writer(file)
             writer.writerow([date, description, category, amount, transaction_type])
-        logging.info(f"Transaction added successfully: {date}, {description}, {category}, {amount}, {transaction_type}")
+        logger.info("Transaction added successfully: %s, %s, %s, %s, %s", date, description, category, amount, transaction_type)
         print("Transaction added successfully.")
     except ValueError:
         print("Invalid amount. Please enter a valid number.")
@@ -90,7 +127,7 @@ def view_transactions():
                 print(row)
     except FileNotFoundError:
         print("Data file not found.")
-        logging.error("Data file not found.")
+        logger.error("Data file not found.")
 
 def edit_transaction():
     """Edit a transaction in the data file."""
@@ -134,14 +171,14 @@ def edit_transaction():
             writer.writerows(transactions)
 
         print("Transaction updated successfully.")
-        logging.info(f"Transaction {transaction_id} updated successfully.")
+        logger.info("Transaction %s updated successfully.", transaction_id)
 
     except ValueError as e:
         print(f"Error: {e}")
-        logging.error(f"Error editing transaction: {e}")
+        logger.error("Error editing transaction: %s", e)
     except Exception as e:
         print(f"An error occurred: {e}")
-        logging.error(f"Error occurred during transaction edit: {e}")
+        logger.error("Error occurred during transaction edit: %s", e)
 
 def categorize_transactions(category_mapping, transaction_type):
     """Categorize transactions based on predefined mappings."""
@@ -164,14 +201,14 @@ def categorize_transactions(category_mapping, transaction_type):
             writer.writeheader()
             writer.writerows(transactions)
 
-        logging.info(f"{transaction_type.capitalize()}s categorized successfully.")
+        logger.info("%ss categorized successfully.", transaction_type.capitalize())
         print(f"{transaction_type.capitalize()}s categorized successfully.")
     except FileNotFoundError:
         print("Data file not found.")
-        logging.error("Data file not found.")
+        logger.error("Data file not found.")
     except Exception as e:
         print(f"An error occurred: {e}")
-        logging.error(f"Error occurred during {transaction_type} categorization: {e}")
+        logger.error("Error occurred during %s categorization: %s", transaction_type, e)
 def search_transactions():
     """Search for transactions containing a specific keyword."""
     try:
@@ -187,10 +224,10 @@ def search_transactions():
                 print("No transactions found matching the search term.")
     except FileNotFoundError:
         print("Data file not found.")
-        logging.error("Data file not found.")
+        logger.error("Data file not found.")
     except Exception as e:
         print(f"An error occurred: {e}")
-        logging.error(f"Error occurred during transaction search: {e}")
+        logger.error("Error occurred during transaction search: %s", e)
 
 def generate_report():
     """Generate a financial report based on transactions."""
@@ -211,10 +248,10 @@ def generate_report():
         print(f"Net Income: {total_income + total_expense}")
     except FileNotFoundError:
         print("Data file not found.")
-        logging.error("Data file not found.")
+        logger.error("Data file not found.")
     except Exception as e:
         print(f"An error occurred: {e}")
-        logging.error(f"Error occurred during report generation: {e}")
+        logger.error("Error occurred during report generation: %s", e)
 
 def analyze_report():
     """Analyze transactions for generating reports."""
@@ -234,10 +271,10 @@ def analyze_report():
             print(f"{category}: {total}")
     except FileNotFoundError:
         print("Data file not found.")
-        logging.error("Data file not found.")
+        logger.error("Data file not found.")
     except Exception as e:
         print(f"An error occurred: {e}")
-        logging.error(f"Error occurred during report analysis: {e}")
+        logger.error("Error occurred during report analysis: %s", e)
 
 def manage_debt():
     """Calculate and manage total debt."""
@@ -253,10 +290,10 @@ def manage_debt():
         print(f"Total debt: {total_debt}")
     except FileNotFoundError:
         print("Data file not found.")
-        logging.error("Data file not found.")
+        logger.error("Data file not found.")
     except Exception as e:
         print(f"An error occurred: {e}")
-        logging.error(f"Error occurred during debt management: {e}")
+        logger.error("Error occurred during debt management: %s", e)
 
 def retirement_planning():
     """Plan for retirement based on user inputs."""
@@ -273,10 +310,10 @@ def retirement_planning():
         print(f"To retire comfortably at age {retirement_age}, you need to save ${total_savings_needed:,.2f} in total, assuming a life expectancy of {life_expectancy}.")
     except ValueError as e:
         print("Invalid input. Please enter valid numeric values.")
-        logging.error(f"Invalid input during retirement planning: {e}")
+        logger.error("Invalid input during retirement planning: %s", e)
     except Exception as e:
         print(f"An error occurred: {e}")
-        logging.error(f"Error occurred during retirement planning: {e}")
+        logger.error("Error occurred during retirement planning: %s", e)
 
 def track_insurance():
     """Track insurance policy details."""
@@ -293,10 +330,10 @@ def track_insurance():
         print(f"Start Date: {policy_start_date}")
     except ValueError as e:
         print("Invalid input. Please enter a valid numeric value for the premium amount.")
-        logging.error(f"Invalid input during insurance tracking: {e}")
+        logger.error("Invalid input during insurance tracking: %s", e)
     except Exception as e:
         print(f"An error occurred: {e}")
-        logging.error(f"Error occurred during insurance tracking: {e}")
+        logger.error("Error occurred during insurance tracking: %s", e)
 
 def track_credit_score():
     """Track and evaluate the user's credit score."""
@@ -314,10 +351,10 @@ def track_credit_score():
             print("Very poor credit score. You may need to work on improving your credit history.")
     except ValueError as e:
         print("Invalid input. Please enter a valid numeric credit score.")
-        logging.error(f"Invalid input during credit score tracking: {e}")
+        logger.error("Invalid input during credit score tracking: %s", e)
     except Exception as e:
         print(f"An error occurred: {e}")
-        logging.error(f"Error occurred during credit score tracking: {e}")
+        logger.error("Error occurred during credit score tracking: %s", e)
 
 def delete_transaction():
     """Delete a transaction from the data file."""
@@ -338,12 +375,12 @@ def delete_transaction():
             writer.writerows(transactions)
 
         print("Transaction deleted successfully.")
-        logging.info(f"Transaction {transaction_id} deleted successfully.")
+        logger.info("Transaction %s deleted successfully.", transaction_id)
     except ValueError:
         print("Invalid input. Please enter a number.")
     except Exception as e:
         print(f"An error occurred: {e}")
-        logging.error(f"Error occurred during transaction deletion: {e}")
+        logger.error("Error occurred during transaction deletion: %s", e)
 
 def delete_category():
     """Delete a category from the data file."""
@@ -363,13 +400,13 @@ def delete_category():
             writer.writerows(updated_transactions)
 
         print(f"Category '{category_to_delete}' and all associated transactions have been deleted.")
-        logging.info(f"Category '{category_to_delete}' and all associated transactions have been deleted.")
+        logger.info("Category '%s' and all associated transactions have been deleted.", category_to_delete)
     except FileNotFoundError:
         print("Data file not found.")
-        logging.error("Data file not found.")
+        logger.error("Data file not found.")
     except Exception as e:
         print(f"An error occurred: {e}")
-        logging.error(f"Error occurred during category deletion: {e}")
+        logger.error("Error occurred during category deletion: %s", e)
 
 def main():
     """Main function to run the program."""
@@ -485,4 +522,8 @@ def data_management_menu():
         else:
             print("Invalid choice. Please try again.")
 if __name__ == "__main__":
-    main()
+    listener = setup_logging()
+    try:
+        main()
+    finally:
+        shutdown_logging(listener)
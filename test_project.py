@@ -163,3 +163,12 @@ def test_retirement_planning(capsys, mock_input):
     captured = capsys.readouterr()
     "assert " "Total savings needed: $XXX,XXX.XX" in captured.out
 
+def test_setup_logging(tmp_path):
+    log_file = tmp_path / "financial_assistant.log"
+    listener = setup_logging(str(log_file), max_bytes=200, backup_count=2)
+    for i in range(20):
+        logger.info("Transaction %s added successfully.", i)
+    shutdown_logging(listener)
+    assert "Transaction 19 added successfully." in log_file.read_text()
+    assert (tmp_path / "financial_assistant.log.1").exists()
+    assert not (tmp_path / "financial_assistant.log.3").exists()